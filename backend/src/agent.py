@@ -23,14 +23,16 @@ logger = logging.getLogger("agent")
 
 load_dotenv(".env.local")
 
+ASSISTANT_INSTRUCTIONS = """You are a helpful voice AI assistant. The user is interacting with you via voice, even if you perceive the conversation as text.
+You eagerly assist users with their questions by providing information from your extensive knowledge.
+Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
+You are curious, friendly, and have a sense of humor."""
+
 
 class Assistant(Agent):
     def __init__(self) -> None:
         super().__init__(
-            instructions="""You are a helpful voice AI assistant. The user is interacting with you via voice, even if you perceive the conversation as text.
-            You eagerly assist users with their questions by providing information from your extensive knowledge.
-            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
-            You are curious, friendly, and have a sense of humor.""",
+            instructions=ASSISTANT_INSTRUCTIONS,
         )
 
     # To add tools, use the @function_tool decorator.
@@ -54,6 +56,27 @@ class Assistant(Agent):
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
 
+    # Each job process runs a single session, so the plugin clients can be built here,
+    # before a job is assigned, instead of on the call path in the entrypoint
+    # Speech-to-text (STT) is your agent's ears, turning the user's speech into text that the LLM can understand
+    # See all available models at https://docs.livekit.io/agents/models/stt/
+    proc.userdata["stt"] = deepgram.STT(model="nova-3")
+    # A Large Language Model (LLM) is your agent's brain, processing user input and generating a response
+    # See all available models at https://docs.livekit.io/agents/models/llm/
+    # Gemini 2.5 implicitly caches repeated prompt prefixes, so keep the instructions constant
+    # (no per-session interpolation) to get cache hits; they show up as prompt_cached_tokens in the metrics
+    proc.userdata["llm"] = google.LLM(
+        model="gemini-2.5-flash",
+    )
+    # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
+    # See all available models as well as voice selections at https://docs.livekit.io/agents/models/tts/
+    proc.userdata["tts"] = murf.TTS(
+        voice="en-US-matthew",
+        style="Conversation",
+        tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
+        text_pacing=True,
+    )
+
 
 async def entrypoint(ctx: JobContext):
     # Logging setup
@@ -64,24 +87,14 @@ async def entrypoint(ctx: JobContext):
 
     # Set up a voice AI pipeline using OpenAI, Cartesia, AssemblyAI, and the LiveKit turn detector
     session = AgentSession(
-        # Speech-to-text (STT) is your agent's ears, turning the user's speech into text that the LLM can understand
-        # See all available models at https://docs.livekit.io/agents/models/stt/
-        stt=deepgram.STT(model="nova-3"),
-        # A Large Language Model (LLM) is your agent's brain, processing user input and generating a response
-        # See all available models at https://docs.livekit.io/agents/models/llm/
-        llm=google.LLM(
-                model="gemini-2.5-flash",
-            ),
-        # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
-        # See all available models as well as voice selections at https://docs.livekit.io/agents/models/tts/
-        tts=murf.TTS(
-                voice="en-US-matthew", 
-                style="Conversation",
-                tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
-                text_pacing=True
-            ),
+        # STT, LLM and TTS clients are created once per process in prewarm
+        stt=ctx.proc.userdata["stt"],
+        llm=ctx.proc.userdata["llm"],
+        tts=ctx.proc.userdata["tts"],
         # VAD and turn detection are used to determine when the user is speaking and when the agent should respond
         # See more at https://docs.livekit.io/agents/build/turns
+        # MultilingualModel binds to the job's inference executor, so it can't be created in prewarm.
+        # The model weights are loaded once per worker by the shared inference process, not per session
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
         # allow the LLM to generate a response while waiting for the end of turn